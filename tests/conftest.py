@@ -0,0 +1,73 @@
+"""
+
+テスト全体で共有するフィクスチャ
+
+- memory_keyring: 各テストをメモリ上の空のkeyringで実行する
+- store_path: 一時ディレクトリ内のCookieの保存先を返す
+
+"""
+
+
+# SECTION: Packages(Type Annotation)
+from typing import Dict, Iterator, Optional, Tuple
+
+# SECTION: Packages(Built-in)
+from pathlib import Path
+
+# SECTION: Packages(Third-Party)
+import keyring
+import pytest
+from keyring.backend import KeyringBackend
+
+# SECTION: Packages(Local)
+from vrchatapi_extensions.utils import crypto
+
+
+# SECTION: Public Classes
+class MemoryKeyring(KeyringBackend):
+
+    """
+
+    テスト用にパスワードをメモリ上に保持するkeyringバックエンド
+
+    """
+
+    priority = 1
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.passwords: Dict[Tuple[str, str], str] = {}
+
+    def get_password(self, service: str, username: str) -> Optional[str]:
+        return self.passwords.get((service, username))
+
+    def set_password(self, service: str, username: str, password: str) -> None:
+        self.passwords[(service, username)] = password
+
+    def delete_password(self, service: str, username: str) -> None:
+        self.passwords.pop((service, username), None)
+
+
+# SECTION: Fixtures
+@pytest.fixture(autouse=True)
+def memory_keyring() -> Iterator[MemoryKeyring]:
+
+    """
+
+    各テストを空のkeyringとプロセス内の鍵キャッシュが空の状態で実行する
+
+    """
+
+    backend: MemoryKeyring = MemoryKeyring()
+    previous = keyring.get_keyring()
+
+    keyring.set_keyring(backend)
+    crypto._fetch_key.cache_clear()  # pylint: disable=protected-access
+    yield backend
+    crypto._fetch_key.cache_clear()  # pylint: disable=protected-access
+    keyring.set_keyring(previous)
+
+
+@pytest.fixture
+def store_path(tmp_path: Path) -> Path:
+    return tmp_path / "vault" / "cookie.enc"
@@ -0,0 +1,231 @@
+"""
+
+CookieVaultの保存形式（AES-GCM）と旧形式（Fernet）からの移行、
+およびSet-CookieヘッダーからのCookieの抽出に関するテスト
+
+"""
+
+
+# SECTION: Packages(Type Annotation)
+from typing import Any, Dict, Optional
+
+# SECTION: Packages(Built-in)
+import base64
+import json
+from pathlib import Path
+
+# SECTION: Packages(Third-Party)
+import pytest
+from cryptography.exceptions import InvalidTag
+from cryptography.fernet import Fernet
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from keyring.backend import KeyringBackend
+
+# SECTION: Packages(Local)
+from vrchatapi_extensions.utils.crypto import CookieVault
+
+
+# SECTION: Constants
+SERVICE: str = "vrchatapi_extensions-test"
+ACCOUNT: str = "cookie-dek"
+COOKIES: Dict[str, str] = {"auth": "authcookie_abc", "twoFactorAuth": "tfa_xyz"}
+
+
+# SECTION: Private Functions
+def _vault(store_path: Path) -> CookieVault:
+    return CookieVault(SERVICE, ACCOUNT, store_path)
+
+
+def _write_legacy(store_path: Path, backend: KeyringBackend) -> bytes:
+
+    """
+
+    旧バージョンと同じ手順（Fernetの鍵をkeyringに保存し、Fernetトークンを書き込む）で保存する
+
+    """
+
+    key: bytes = Fernet.generate_key()
+    token: bytes = Fernet(key).encrypt(json.dumps(COOKIES).encode("utf-8"))
+
+    backend.set_password(SERVICE, ACCOUNT, key.decode("ascii"))
+    store_path.parent.mkdir(parents=True)
+    store_path.write_bytes(token)
+
+    return token
+
+
+# SECTION: Tests
+def test_save_writes_versioned_gcm_and_round_trips(store_path: Path) -> None:
+    _vault(store_path).save(COOKIES)
+
+    assert store_path.read_bytes()[:1] == b"\x01"
+
+    vault = _vault(store_path)
+    vault.load()
+
+    assert not vault.is_legacy
+    assert vault.get("auth") == COOKIES["auth"]
+    assert vault.cookie_header == "auth=authcookie_abc; twoFactorAuth=tfa_xyz"
+
+
+def test_gcm_key_is_derived_not_the_raw_keyring_key(
+    store_path: Path,
+    memory_keyring: KeyringBackend
+) -> None:
+    _vault(store_path).save(COOKIES)
+
+    token = store_path.read_bytes()
+    raw = base64.urlsafe_b64decode(memory_keyring.get_password(SERVICE, ACCOUNT))
+
+    with pytest.raises(InvalidTag):
+        AESGCM(raw).decrypt(token[1:13], token[13:], token[:1])
+
+
+def test_tampered_ciphertext_is_rejected(store_path: Path) -> None:
+    _vault(store_path).save(COOKIES)
+    token = bytearray(store_path.read_bytes())
+    token[-1] ^= 0x01
+    store_path.write_bytes(bytes(token))
+
+    vault = _vault(store_path)
+    vault.load()
+
+    with pytest.raises(InvalidTag):
+        vault.get("auth")
+
+
+def test_legacy_fernet_vault_is_read_without_writing(
+    store_path: Path,
+    memory_keyring: KeyringBackend
+) -> None:
+    legacy = _write_legacy(store_path, memory_keyring)
+
+    vault = _vault(store_path)
+    vault.load()
+
+    assert vault.is_legacy
+    assert vault.cookie_header == "auth=authcookie_abc; twoFactorAuth=tfa_xyz"
+    assert store_path.read_bytes() == legacy
+
+
+def test_migrate_rewrites_legacy_vault_as_gcm(
+    store_path: Path,
+    memory_keyring: KeyringBackend
+) -> None:
+    _write_legacy(store_path, memory_keyring)
+
+    vault = _vault(store_path)
+
+    assert vault.migrate()
+    assert not vault.is_legacy
+    assert store_path.read_bytes()[:1] == b"\x01"
+    assert not vault.migrate()
+
+    reloaded = _vault(store_path)
+    reloaded.load()
+
+    assert reloaded.get("auth") == COOKIES["auth"]
+    assert reloaded.get("twoFactorAuth") == COOKIES["twoFactorAuth"]
+
+
+def test_save_of_unchanged_cookies_still_migrates_legacy_vault(
+    store_path: Path,
+    memory_keyring: KeyringBackend
+) -> None:
+    _write_legacy(store_path, memory_keyring)
+
+    vault = _vault(store_path)
+    vault.load()
+
+    # NOTE: 復号済みのキャッシュと同じ内容でも、旧形式のファイルは書き換える
+    assert vault.get("auth") == COOKIES["auth"]
+    vault.save(dict(COOKIES))
+
+    assert store_path.read_bytes()[:1] == b"\x01"
+
+
+@pytest.mark.parametrize(
+    ("set_cookie", "expected"),
+    [
+        pytest.param(
+            "auth=abc; Expires=Wed, 21 Oct 2026 07:28:00 GMT; Path=/, "
+            "twoFactorAuth=tfa; Expires=Wed, 21 Oct 2026 07:28:00 GMT; HttpOnly",
+            {"auth": "abc", "twoFactorAuth": "tfa"},
+            id="folded-with-expires-commas"
+        ),
+        pytest.param(
+            ["auth=abc; Path=/; HttpOnly", "twoFactorAuth=tfa; Path=/; HttpOnly"],
+            {"auth": "abc", "twoFactorAuth": "tfa"},
+            id="list-valued"
+        ),
+        pytest.param(
+            'auth="abc"; Path=/, twoFactorAuth="tfa"; Path=/',
+            {"auth": "abc", "twoFactorAuth": "tfa"},
+            id="quoted-values"
+        ),
+        pytest.param(
+            "session=xyz; auth=abc; Path=/",
+            None,
+            id="auth-in-attribute-position"
+        ),
+        pytest.param(
+            "twoFactorAuth=tfa; Path=/",
+            None,
+            id="two-factor-only"
+        ),
+        pytest.param(
+            ["auth=; Max-Age=0; Path=/", "auth=new; Path=/"],
+            {"auth": "new", "twoFactorAuth": None},
+            id="empty-auth-then-later-auth"
+        ),
+        pytest.param(
+            "auth=; Expires=Thu, 01 Jan 1970 00:00:00 GMT, auth=new; Path=/",
+            {"auth": "new", "twoFactorAuth": None},
+            id="empty-auth-then-later-auth-folded"
+        )
+    ]
+)
+def test_extract(set_cookie: Any, expected: Optional[Dict[str, Optional[str]]]) -> None:
+    assert CookieVault.extract({"Set-Cookie": set_cookie}) == expected
+
+
+def test_extract_reads_lowercase_header_and_ignores_missing() -> None:
+    assert CookieVault.extract({"set-cookie": "auth=abc"}) == {"auth": "abc", "twoFactorAuth": None}
+    assert CookieVault.extract({}) is None
+    assert CookieVault.extract(None) is None
+
+
+def test_save_skips_rewrite_when_file_still_holds_same_cookies(store_path: Path) -> None:
+    vault = _vault(store_path)
+    vault.save(dict(COOKIES))
+    written = store_path.read_bytes()
+
+    vault.save(dict(COOKIES))
+
+    # NOTE: 暗号化のnonceは毎回異なるので、書き換えられていればバイト列が変わる
+    assert store_path.read_bytes() == written
+
+
+def test_save_rewrites_when_another_vault_changed_the_file(store_path: Path) -> None:
+    vault = _vault(store_path)
+    vault.save(dict(COOKIES))
+
+    other = _vault(store_path)
+    other.save({"auth": "other_auth", "twoFactorAuth": None})
+
+    vault.save(dict(COOKIES))
+
+    reloaded = _vault(store_path)
+    reloaded.load()
+
+    assert reloaded.get("auth") == COOKIES["auth"]
+
+
+def test_save_rewrites_when_file_was_removed(store_path: Path) -> None:
+    vault = _vault(store_path)
+    vault.save(dict(COOKIES))
+    store_path.unlink()
+
+    vault.save(dict(COOKIES))
+
+    assert store_path.exists()
@@ -0,0 +1,216 @@
+"""
+
+マニュアルログインの2段階認証パスで保存されるCookieに関するテスト
+
+"""
+
+
+# SECTION: Packages(Type Annotation)
+from typing import Any, Dict, List, Optional, Tuple
+
+# SECTION: Packages(Built-in)
+from pathlib import Path
+
+# SECTION: Packages(Third-Party)
+import pytest
+from vrchatapi.exceptions import UnauthorizedException
+
+# SECTION: Packages(Local)
+from vrchatapi_extensions.api.authentication import login as login_module
+from vrchatapi_extensions.utils.crypto import CookieVault
+
+
+# SECTION: Constants
+TOTP_REASON:  str = '{"requiresTwoFactorAuth": ["totp"]} 2 Factor Authentication required'
+EMAIL_REASON: str = '{"requiresTwoFactorAuth": ["emailOtp"]} Email 2 Factor Authentication required'
+
+
+# SECTION: Private Classes
+class _StubAuthenticationApi:
+
+    """
+
+    最初のユーザー情報の取得で2段階認証を要求し、以降は成功するAuthenticationApiのスタブ
+    各応答のSet-Cookieはクラス属性で差し替える
+
+    """
+
+    reason:         str                       = TOTP_REASON
+    first_cookies:  List[str]                 = ["auth=first; Path=/; HttpOnly"]
+    verify_cookies: List[str]                 = ["twoFactorAuth=tfa; Path=/; HttpOnly"]
+    final_cookies:  List[str]                 = []
+    calls:          List[Tuple[str, Any]]     = []
+
+    def __init__(self, api_client: Any) -> None:
+        self.api_client = api_client
+        self.requested = False
+
+    def get_current_user_with_http_info(self) -> Tuple[Dict[str, str], int, Dict[str, Any]]:
+        if not self.requested:
+            self.requested = True
+            error = UnauthorizedException(status=200, reason=self.reason)
+            error.headers = {"Set-Cookie": list(self.first_cookies)}
+            raise error
+        return {"id": "usr_test"}, 200, {"Set-Cookie": list(self.final_cookies)}
+
+    def verify2_fa_with_http_info(self, two_factor_auth_code: Any) -> Tuple[None, int, Dict]:
+        type(self).calls.append(("totp", two_factor_auth_code.code))
+        return None, 200, {"Set-Cookie": list(self.verify_cookies)}
+
+    def verify2_fa_email_code_with_http_info(
+        self,
+        two_factor_email_code: Any
+    ) -> Tuple[None, int, Dict]:
+        type(self).calls.append(("email", two_factor_email_code.code))
+        return None, 200, {"Set-Cookie": list(self.verify_cookies)}
+
+
+# SECTION: Fixtures
+@pytest.fixture
+def stub_api(monkeypatch: pytest.MonkeyPatch) -> type:
+
+    """
+
+    AuthenticationApiをスタブに差し替え、呼び出し記録を初期化する
+
+    """
+
+    stub: type = type("StubAuthenticationApi", (_StubAuthenticationApi,), {"calls": []})
+
+    monkeypatch.setattr("vrchatapi.api.authentication_api.AuthenticationApi", stub)
+
+    return stub
+
+
+@pytest.fixture
+def saved(monkeypatch: pytest.MonkeyPatch) -> List[Dict[str, Optional[str]]]:
+
+    """
+
+    CookieVault.save()に渡されたCookieを記録する（保存自体はそのまま行う）
+
+    """
+
+    records:  List[Dict[str, Optional[str]]] = []
+    original: Any = CookieVault.save
+
+    def spy(self: CookieVault, cookies: Dict[str, Optional[str]]) -> None:
+        records.append(dict(cookies))
+        original(self, cookies)
+
+    monkeypatch.setattr(CookieVault, "save", spy)
+
+    return records
+
+
+# SECTION: Private Functions
+def _login(store_path: Path, prompts: List[str]) -> None:
+
+    """
+
+    リトライを介さずに、ユーザー名とパスワードを渡してマニュアルログインを実行する
+
+    """
+
+    def prompt(message: str) -> str:
+        prompts.append(message)
+        return "123456"
+
+    login_module.login.__wrapped__(
+        "user", "pass", "agent", prompt=prompt, vault=CookieVault(store_path=store_path)
+    )
+
+
+# SECTION: Tests
+def test_two_factor_login_saves_auth_and_two_factor_cookies(
+    store_path: Path,
+    stub_api: type,
+    saved: List[Dict[str, Optional[str]]]
+) -> None:
+    _login(store_path, [])
+
+    assert saved == [{"auth": "first", "twoFactorAuth": "tfa"}]
+    assert stub_api.calls == [("totp", "123456")]
+
+    reloaded = CookieVault(store_path=store_path)
+    reloaded.load()
+
+    assert reloaded.cookie_header == "auth=first; twoFactorAuth=tfa"
+
+
+def test_later_auth_cookie_overrides_earlier_one(
+    store_path: Path,
+    stub_api: type,
+    saved: List[Dict[str, Optional[str]]]
+) -> None:
+    stub_api.final_cookies = ["auth=second; Path=/; HttpOnly"]
+
+    _login(store_path, [])
+
+    assert saved == [{"auth": "second", "twoFactorAuth": "tfa"}]
+
+
+@pytest.mark.parametrize(
+    ("reason", "kind", "message"),
+    [
+        (TOTP_REASON, "totp", "2FA Code: "),
+        (EMAIL_REASON, "email", "Email 2FA Code: ")
+    ]
+)
+def test_two_factor_kind_is_chosen_from_reason(  # pylint: disable=too-many-arguments
+    store_path: Path,
+    stub_api: type,
+    saved: List[Dict[str, Optional[str]]],
+    reason: str,
+    kind: str,
+    message: str
+) -> None:
+    stub_api.reason = reason
+    prompts: List[str] = []
+
+    _login(store_path, prompts)
+
+    assert login_module._TWO_FACTOR_PATTERN.search(reason)  # pylint: disable=protected-access
+    assert stub_api.calls == [(kind, "123456")]
+    assert prompts == [message]
+    assert saved[-1]["twoFactorAuth"] == "tfa"
+
+
+def test_cookie_login_reloads_vault_rewritten_by_another_process(
+    store_path: Path,
+    monkeypatch: pytest.MonkeyPatch
+) -> None:
+    vault = CookieVault(store_path=store_path)
+    vault.save({"auth": "stale", "twoFactorAuth": None})
+    assert vault.ensure_loaded()
+
+    # NOTE: 別プロセスによる再ログインを、同じファイルを指す別のVaultからの保存で再現する
+    CookieVault(store_path=store_path).save({"auth": "fresh", "twoFactorAuth": None})
+
+    class CookieOnlyApi:
+
+        """
+
+        Cookieがauth=freshの場合だけユーザー情報を返すAuthenticationApiのスタブ
+
+        """
+
+        def __init__(self, api_client: Any) -> None:
+            self.api_client = api_client
+
+        def get_current_user_with_http_info(self) -> Tuple[Dict[str, str], int, Dict[str, Any]]:
+            if self.api_client.default_headers.get("Cookie") != "auth=fresh":
+                raise UnauthorizedException(status=401, reason="Missing Credentials")
+            return {"id": "usr_test"}, 200, {}
+
+    def prompt(message: str) -> str:
+        raise AssertionError(f"unexpected prompt: {message}")
+
+    monkeypatch.setattr("vrchatapi.api.authentication_api.AuthenticationApi", CookieOnlyApi)
+
+    response = login_module.login.__wrapped__(
+        agent="agent", prompt=prompt, secret_prompt=prompt, vault=vault
+    )
+
+    assert response.status == 200
+    assert vault.get("auth") == "fresh"
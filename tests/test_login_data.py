@@ -0,0 +1,47 @@
+"""
+
+LoginResponseのヘッダー情報の複製と読み取り専用化に関するテスト
+
+"""
+
+
+# SECTION: Packages(Type Annotation)
+from typing import Any, Dict
+
+# SECTION: Packages(Third-Party)
+import pytest
+from urllib3 import HTTPHeaderDict
+
+# SECTION: Packages(Local)
+from vrchatapi_extensions.api.authentication.payload import LoginResponse
+
+
+# SECTION: Tests
+def test_headers_are_copied_from_plain_dict() -> None:
+    headers: Dict[str, Any] = {"Set-Cookie": "auth=abc"}
+    response = LoginResponse(None, 200, headers)
+
+    headers["Set-Cookie"] = "auth=changed"
+    headers["X-Added"] = "1"
+
+    assert dict(response.headers) == {"Set-Cookie": "auth=abc"}
+
+
+def test_headers_are_copied_from_http_header_dict() -> None:
+    headers = HTTPHeaderDict()
+    headers.add("Set-Cookie", "auth=abc")
+    response = LoginResponse(None, 200, headers)
+
+    # NOTE: copy.copy()ではHTTPHeaderDictの中身が共有され、この変更が見えてしまう
+    headers.add("Set-Cookie", "twoFactorAuth=tfa")
+    headers["X-Added"] = "1"
+
+    assert dict(response.headers) == {"Set-Cookie": "auth=abc"}
+    assert response.headers.get("set-cookie") == "auth=abc"
+
+
+def test_headers_reject_item_assignment() -> None:
+    response = LoginResponse(None, 200, {"Set-Cookie": "auth=abc"})
+
+    with pytest.raises(TypeError):
+        response.headers["Set-Cookie"] = "auth=changed"  # type: ignore[index]
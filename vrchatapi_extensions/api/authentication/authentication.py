@@ -8,15 +8,23 @@ https://vrchat.community/reference/
 """
 
 
+from __future__ import annotations
+
 # SECTION: Packages(Type Annotation)
-from multiprocessing import pool
-from typing import Optional
+from typing import TYPE_CHECKING, Callable, Optional
+
+# SECTION: Packages(Built-in)
+import asyncio
+import getpass
 
 # SECTION: Packages(Third-Party)
 from tenacity import RetryError
 from vrchatapi_extensions.constant import constant
 from vrchatapi_extensions.utils import CookieVault
 
+if TYPE_CHECKING:
+    from vrchatapi.api_client import ApiClient
+
 # SECTION: Packages(Local)
 from .login import login
 from .payload import LoginResponse
@@ -31,16 +39,23 @@ class Authentication:
     認証に関連する機能のインターフェースを提供する
 
     - login() -> LoginResponse ... GET
+    - alogin() -> LoginResponse ... GET（非同期版）
     - verify_auth_token() -> bool ... GET
+    - averify_auth_token() -> bool ... GET（非同期版）
 
     """
 
     @classmethod
-    def login(
+    def login(  # pylint: disable=too-many-arguments
         cls,
-        username: Optional[str] = None,
-        password: Optional[str] = None,
-        agent:    str           = constant.AGENT
+        username:      Optional[str]         = None,
+        password:      Optional[str]         = None,
+        agent:         str                   = constant.AGENT,
+        prompt:        Callable[[str], str]  = input,
+        secret_prompt: Callable[[str], str]  = getpass.getpass,
+        *,
+        client:        Optional[ApiClient]   = None,
+        vault:         Optional[CookieVault] = None
     ) -> LoginResponse:
 
         """
@@ -58,7 +73,8 @@ class Authentication:
         username、password、2段階認証（要求された場合）を用いて
         ログインを試行する
         Cookieによるログインが失敗しない限りusernameとpasswordは利用されない
-        また、usernameとpasswordがNoneの場合、標準入力からそれぞれの入力を要求する
+        また、usernameとpasswordがNoneの場合、promptとsecret_promptでそれぞれの入力を要求する
+        （標準ではinputとgetpass.getpassを用いて標準入力から要求する）
         認証は自動的に3回リトライされる
 
         :param username: ログインを試行するユーザー名またはメールアドレス
@@ -70,8 +86,20 @@ class Authentication:
         :param agent: ログインリクエストに添付するエージェント
         :type agent: str
 
+        :param prompt: ユーザー名や2段階認証コードの入力を要求する関数
+        :type prompt: Callable[[str], str]
+
+        :param secret_prompt: パスワードの入力を要求する関数
+        :type secret_prompt: Callable[[str], str]
+
+        :param client: リクエストに用いるApiClientオブジェクト（Noneで使い捨てのApiClientを構築）
+        :type client: Optional[ApiClient]
+
+        :param vault: Cookieの読み込みと保存に用いるCookieVaultオブジェクト（Noneで共有のCookieVaultを利用）
+        :type vault: Optional[CookieVault]
+
         :return: VRChatAPIサーバーからのレスポンス
-        :rtype: pool.ApplyResult
+        :rtype: LoginResponse
 
         """
 
@@ -80,7 +108,10 @@ class Authentication:
 
         # Process
         try:
-            result = login(username, password, agent)
+            result = login(
+                username, password, agent, prompt, secret_prompt,
+                client=client, vault=vault
+            )
         except RetryError as e :
             raise e.last_attempt.result()
         except Exception as e:
@@ -91,8 +122,9 @@ class Authentication:
     @classmethod
     def verify_auth_token(
         cls,
-        agent: Optional[str] = None,
-        vault: CookieVault   = CookieVault()
+        agent:  Optional[str]         = None,
+        vault:  Optional[CookieVault] = None,
+        client: Optional[ApiClient]   = None
     ) -> bool:
 
         """
@@ -111,6 +143,9 @@ class Authentication:
         :param vault:
         :type vault: Optional[CookieVault]
 
+        :param client: リクエストに用いるApiClientオブジェクト（Noneで使い捨てのApiClientを構築）
+        :type client: Optional[ApiClient]
+
         :return: Cookieが有効であるかのbool値
         :rtype: bool
 
@@ -121,8 +156,92 @@ class Authentication:
 
         # Process
         try:
-            result = verify_auth_token(agent, vault)
+            result = verify_auth_token(agent, vault, client)
         except Exception as e:
             raise e
 
         return result
+
+    @classmethod
+    async def alogin(  # pylint: disable=too-many-arguments
+        cls,
+        username:      Optional[str]         = None,
+        password:      Optional[str]         = None,
+        agent:         str                   = constant.AGENT,
+        prompt:        Callable[[str], str]  = input,
+        secret_prompt: Callable[[str], str]  = getpass.getpass,
+        *,
+        client:        Optional[ApiClient]   = None,
+        vault:         Optional[CookieVault] = None
+    ) -> LoginResponse:
+
+        """
+
+        login()の非同期版
+        vrchatapiの通信は同期処理なので、ワーカースレッドでlogin()を実行し、イベントループをブロックしない
+        複数アカウントのログインをasyncio.gatherでまとめて待機する場合は、呼び出しごとに
+        保存先（store_path）の異なるvaultを渡すこと（vaultを省略すると全ての呼び出しが共有のCookieVaultを使う）
+        また、ログイン中はclientに認証情報が設定されるので、同時に実行する呼び出し間でclientを共有しないこと
+
+        :param username: ログインを試行するユーザー名またはメールアドレス
+        :type username: Optional[str]
+
+        :param password: ログインを試行するパスワード
+        :type password: Optional[str]
+
+        :param agent: ログインリクエストに添付するエージェント
+        :type agent: str
+
+        :param prompt: ユーザー名や2段階認証コードの入力を要求する関数
+        :type prompt: Callable[[str], str]
+
+        :param secret_prompt: パスワードの入力を要求する関数
+        :type secret_prompt: Callable[[str], str]
+
+        :param client: リクエストに用いるApiClientオブジェクト（Noneで使い捨てのApiClientを構築）
+        :type client: Optional[ApiClient]
+
+        :param vault: Cookieの読み込みと保存に用いるCookieVaultオブジェクト（Noneで共有のCookieVaultを利用）
+        :type vault: Optional[CookieVault]
+
+        :return: VRChatAPIサーバーからのレスポンス
+        :rtype: LoginResponse
+
+        """
+
+        # Process
+        return await asyncio.to_thread(
+            cls.login, username, password, agent, prompt, secret_prompt,
+            client=client, vault=vault
+        )
+
+    @classmethod
+    async def averify_auth_token(
+        cls,
+        agent:  Optional[str]         = None,
+        vault:  Optional[CookieVault] = None,
+        client: Optional[ApiClient]   = None
+    ) -> bool:
+
+        """
+
+        verify_auth_token()の非同期版
+        vrchatapiの通信は同期処理なので、ワーカースレッドでverify_auth_token()を実行し、
+        イベントループをブロックしない
+
+        :param agent: リクエストに添付するエージェント文字列（NoneでConstant値を利用）
+        :type agent: Optional[str]
+
+        :param vault: 端末に保存されたCookieの情報をマネジメントするオブジェクト
+        :type vault: Optional[CookieVault]
+
+        :param client: リクエストに用いるApiClientオブジェクト（Noneで使い捨てのApiClientを構築）
+        :type client: Optional[ApiClient]
+
+        :return: Cookieが有効であるかのbool値
+        :rtype: bool
+
+        """
+
+        # Process
+        return await asyncio.to_thread(cls.verify_auth_token, agent, vault, client)
@@ -8,25 +8,43 @@ VRChatAPIを用いたログイン処理を行う機能を提供する
 """
 
 
+from __future__ import annotations
+
 # SECTION: Packages(Type Annotation)
-from typing import Dict, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    Final,
+    List,
+    Mapping,
+    Optional,
+    Tuple
+)
 
 # SECTION: Packages(Built-in)
 import getpass
+import re
+from concurrent.futures import Future, ThreadPoolExecutor
 
 # SECTION: Packages(Third-Party)
-import vrchatapi
 from tenacity import retry, stop_after_attempt, wait_fixed
-from vrchatapi.api.authentication_api import AuthenticationApi
-from vrchatapi.api_client import ApiClient
-from vrchatapi.exceptions import UnauthorizedException
-from vrchatapi.models.two_factor_auth_code import TwoFactorAuthCode
-from vrchatapi.models.two_factor_email_code import TwoFactorEmailCode
+
+# NOTE: vrchatapiは読み込みが重いので、型注釈以外では各関数の中でimportする
+if TYPE_CHECKING:
+    from vrchatapi.api.authentication_api import AuthenticationApi
+    from vrchatapi.api_client import ApiClient
 
 # SECTION: Packages(Local)
 from vrchatapi_extensions.api.authentication.payload import LoginResponse
 from vrchatapi_extensions.constant import constant
-from vrchatapi_extensions.utils import CookieVault
+from vrchatapi_extensions.utils import CookieVault, open_client
+
+# SECTION: Constants
+# NOTE: Email 2FAかTOTP 2FAかを1回の走査で判定する（Email側のグループがマッチしたかで分岐する）
+_TWO_FACTOR_PATTERN: Final[re.Pattern[str]] = re.compile(r"(Email )?2 Factor Authentication")
 
 
 # SECTION: Public Functions
@@ -34,10 +52,15 @@ from vrchatapi_extensions.utils import CookieVault
     stop=stop_after_attempt(constant.LOGIN_RETRY_LIMIT),
     wait=wait_fixed(constant.LOGIN_RETRY_WAIT)
 )
-def login(
-    username: Optional[str] = None,
-    password: Optional[str] = None,
-    agent:    str           = constant.AGENT
+def login(  # pylint: disable=too-many-arguments
+    username:      Optional[str]         = None,
+    password:      Optional[str]         = None,
+    agent:         str                   = constant.AGENT,
+    prompt:        Callable[[str], str]  = input,
+    secret_prompt: Callable[[str], str]  = getpass.getpass,
+    *,
+    client:        Optional[ApiClient]   = None,
+    vault:         Optional[CookieVault] = None
 ) -> LoginResponse:
 
     """
@@ -57,6 +80,18 @@ def login(
     :param agent: ログインリクエストに添付するエージェント文字列（NoneでConstant値を利用）
     :type agent: str
 
+    :param prompt: ユーザー名や2段階認証コードの入力を要求する関数（標準ではinput）
+    :type prompt: Callable[[str], str]
+
+    :param secret_prompt: パスワードの入力を要求する関数（標準ではgetpass.getpass）
+    :type secret_prompt: Callable[[str], str]
+
+    :param client: リクエストに用いるApiClientオブジェクト（Noneで使い捨てのApiClientを構築）
+    :type client: Optional[ApiClient]
+
+    :param vault: Cookieの読み込みと保存に用いるCookieVaultオブジェクト（Noneで共有のCookieVaultを利用）
+    :type vault: Optional[CookieVault]
+
     :return: LoginResultオブジェクト（APIサーバーからのレスポンス）
     :rtype: LoginResponse
 
@@ -64,25 +99,35 @@ def login(
 
     # Initialize
     response: Optional[LoginResponse]
-    vault:    CookieVault
 
     # Process
-    vault = CookieVault()
-    vault.load()
-    if vault.is_active:
-        response = __cookie_login(agent, vault)
+    if vault is None:
+        vault = CookieVault.default()
+
+    if vault.ensure_loaded():
+        response = __cookie_login(
+            username, password, agent, vault,
+            prompt=prompt, secret_prompt=secret_prompt, client=client
+        )
     else:
-        response = __manual_login(username, password, agent, vault)
+        response = __manual_login(
+            username, password, agent, vault,
+            prompt=prompt, secret_prompt=secret_prompt, client=client
+        )
 
     return response
 
 
 # SECTION: Private Functions
-def __manual_login(
-    username: Optional[str] = None,
-    password: Optional[str] = None,
-    agent:    str           = constant.AGENT,
-    vault:    CookieVault   = CookieVault()
+def __manual_login(  # pylint: disable=too-many-arguments,too-many-locals
+    username:      Optional[str]         = None,
+    password:      Optional[str]         = None,
+    agent:         str                   = constant.AGENT,
+    vault:         Optional[CookieVault] = None,
+    *,
+    prompt:        Callable[[str], str]  = input,
+    secret_prompt: Callable[[str], str]  = getpass.getpass,
+    client:        Optional[ApiClient]   = None
 ) -> LoginResponse:
 
     """
@@ -98,8 +143,17 @@ def __manual_login(
     :param agent: ログインリクエストに添付するエージェント文字列（NoneでConstant値を利用）
     :type agent: str
 
-    :param vault: マニュアルログインで得たCookieを保存するためのCookieVaultオブジェクト
-    :type vault: CookieVault
+    :param vault: マニュアルログインで得たCookieを保存するためのCookieVaultオブジェクト（Noneで共有のCookieVaultを利用）
+    :type vault: Optional[CookieVault]
+
+    :param prompt: ユーザー名や2段階認証コードの入力を要求する関数
+    :type prompt: Callable[[str], str]
+
+    :param secret_prompt: パスワードの入力を要求する関数
+    :type secret_prompt: Callable[[str], str]
+
+    :param client: リクエストに用いるApiClientオブジェクト（Noneで使い捨てのApiClientを構築）
+    :type client: Optional[ApiClient]
 
     :return: LoginResultオブジェクト（APIサーバーからのレスポンス）
     :rtype: LoginResponse
@@ -107,26 +161,43 @@ def __manual_login(
     """
 
     # Initialize
-    config:   vrchatapi.Configuration
-    client:   ApiClient
-    auth:     AuthenticationApi
-    response: LoginResponse
-    cookie:   Optional[Dict[str, str]]
+    verified:   Optional[Mapping[str, Any]]
+    executor:   ThreadPoolExecutor
+    pending:    Future
+    context:    ContextManager[ApiClient]
+    api_client: ApiClient
+    auth:       AuthenticationApi
+    response:   LoginResponse
+    cookie:     Optional[Dict[str, str]]
 
     # Process
-    if username is None:
-        username = input("Username or Email: ")
-    if password is None:
-        password = getpass.getpass("Password: ")
+    if vault is None:
+        vault = CookieVault.default()
+
+    if username is None or password is None:
+        # NOTE: 入力待ちの間に、重いvrchatapiのimportとクライアントの構築をバックグラウンドで済ませておく
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pending = executor.submit(__prepare_client, agent, client)
+            if username is None:
+                username = prompt("Username or Email: ")
+            if password is None:
+                password = secret_prompt("Password: ")
+            context = pending.result()
+    else:
+        context = __prepare_client(agent, client)
 
-    config = vrchatapi.Configuration(
-        username=username,
-        password=password
-    )
+    # NOTE: __prepare_client()で読み込み済みなので、ここではsys.modulesから取り出すだけになる
+    # pylint: disable=import-outside-toplevel
+    from vrchatapi.api.authentication_api import AuthenticationApi
+    from vrchatapi.exceptions import UnauthorizedException
 
-    with ApiClient(config) as client:
-        client.user_agent = agent
-        auth = AuthenticationApi(client)
+    with context as api_client:
+        # NOTE: 共有のApiClientに残っている古いCookieを送らないようにする
+        api_client.default_headers.pop("Cookie", None)
+        api_client.rest_client.cookie_jar.clear()
+        api_client.configuration.username = username
+        api_client.configuration.password = password
+        auth = AuthenticationApi(api_client)
 
         try:
             response = LoginResponse(*auth.get_current_user_with_http_info())
@@ -134,31 +205,60 @@ def __manual_login(
             if cookie is not None:
                 vault.save(cookie)
         except UnauthorizedException as e:
-            auth = __two_factor_auth(auth, e.reason)
+            auth, verified = __two_factor_auth(auth, e.reason, prompt)
             response = LoginResponse(*auth.get_current_user_with_http_info())
-            cookie = vault.extract(response.headers)
-            if cookie is None:
-                cookie = vault.extract(e.headers)
-            vault.save(cookie)
+            # NOTE: authは2FA要求時の応答、twoFactorAuthは2FA検証の応答で発行されるので、
+            #       各応答のSet-Cookieをまとめて抽出する（後の応答を優先）
+            # INFO: 2FAのパスは「401応答 → 2FA検証 → ユーザー情報の再取得」の3往復のままで、
+            #       往復回数は削減していない（再取得の応答がログイン結果として必要なため）
+            cookie = vault.extract(__merge_set_cookie(e.headers, verified, response.headers))
+            if cookie is not None:
+                vault.save(cookie)
+        finally:
+            # NOTE: 共有のApiClientに認証情報を残さない
+            api_client.configuration.username = None
+            api_client.configuration.password = None
 
     return response
 
 
-def __cookie_login(
-    agent: str         = constant.AGENT,
-    vault: CookieVault = CookieVault()
+def __cookie_login(  # pylint: disable=too-many-arguments
+    username:      Optional[str]         = None,
+    password:      Optional[str]         = None,
+    agent:         str                   = constant.AGENT,
+    vault:         Optional[CookieVault] = None,
+    *,
+    prompt:        Callable[[str], str]  = input,
+    secret_prompt: Callable[[str], str]  = getpass.getpass,
+    client:        Optional[ApiClient]   = None
 ) -> LoginResponse:
 
     """
 
     端末に保存されたCookieを用いてログイン処理を実行する機能を提供する
-    Cookieによるログインリクエストが失敗した場合、自動的にマニュアルログインにフォールバックする
+    Cookieが否認された場合はCookieファイルを1回だけ読み直し、他のプロセスによって更新されていれば再試行する
+    それでも失敗した場合、自動的にマニュアルログインにフォールバックする
+
+    :param username: フォールバック時にログインに使うユーザー名またはEmailアドレス（Noneでpromptにより入力を要求）
+    :type username: Optional[str]
+
+    :param password: フォールバック時にログインに使うパスワード（Noneでsecret_promptにより入力を要求）
+    :type password: Optional[str]
 
     :param agent: ログインリクエストに添付するエージェント文字列（NoneでConstant値を利用）
     :type agent: str
 
-    :param vault: 端末に保存されたCookieの情報をマネジメントするオブジェクト
-    :type vault: CookieVault
+    :param vault: 端末に保存されたCookieの情報をマネジメントするオブジェクト（Noneで共有のCookieVaultを利用）
+    :type vault: Optional[CookieVault]
+
+    :param prompt: フォールバック時にユーザー名や2段階認証コードの入力を要求する関数
+    :type prompt: Callable[[str], str]
+
+    :param secret_prompt: フォールバック時にパスワードの入力を要求する関数
+    :type secret_prompt: Callable[[str], str]
+
+    :param client: リクエストに用いるApiClientオブジェクト（Noneで使い捨てのApiClientを構築）
+    :type client: Optional[ApiClient]
 
     :return: LoginResultオブジェクト（APIサーバーからのレスポンス）
     :rtype: LoginResponse
@@ -166,31 +266,114 @@ def __cookie_login(
     """
 
     # Initialize
-    config: vrchatapi.Configuration
-    client: ApiClient
-    auth:   AuthenticationApi
+    api_client: ApiClient
+    previous:   str
+    response:   Optional[LoginResponse]
+
+    # Process
+    if vault is None:
+        vault = CookieVault.default()
+        vault.ensure_loaded()
+
+    with open_client(agent, client) as api_client:
+        previous = vault.cookie_header
+        response = __request_with_cookie(api_client, vault)
+
+        # NOTE: 長時間動作するプロセスでは、他のプロセスが再ログインしてファイルを更新している場合がある
+        #       入力を要求する前に1回だけ読み直し、Cookieが変わっていればそれで再試行する
+        if response is None:
+            vault.load()
+            if vault.is_active and vault.cookie_header != previous:
+                response = __request_with_cookie(api_client, vault)
+
+    if response is None:
+        response = __manual_login(
+            username, password, agent, vault,
+            prompt=prompt, secret_prompt=secret_prompt, client=client
+        )
+
+    return response
+
+
+def __request_with_cookie(
+    api_client: ApiClient,
+    vault:      CookieVault
+) -> Optional[LoginResponse]:
+
+    """
+
+    CookieVaultのCookieを設定したApiClientでユーザー情報を取得する機能を提供する
+    Cookieが有効と確認できた場合は、旧形式のCookieファイルを現在の形式に書き換える
+
+    :param api_client: リクエストに用いるApiClientオブジェクト
+    :type api_client: ApiClient
+
+    :param vault: 読み込み済みのCookieVaultオブジェクト
+    :type vault: CookieVault
+
+    :return: LoginResultオブジェクト（Cookieが否認された場合はNone）
+    :rtype: Optional[LoginResponse]
+
+    """
+
+    # Initialize
     response: LoginResponse
 
     # Process
-    config = vrchatapi.Configuration()
+    # NOTE: vrchatapiは読み込みが重いので、実際に通信する時点までimportを遅延させる
+    # pylint: disable=import-outside-toplevel
+    from vrchatapi.api.authentication_api import AuthenticationApi
+    from vrchatapi.exceptions import UnauthorizedException
 
-    with ApiClient(config) as client:
-        client.user_agent = agent
-        vault.set_configuration(client)
-        auth = AuthenticationApi(client)
+    vault.set_configuration(api_client)
 
-        try:
-            response = LoginResponse(*auth.get_current_user_with_http_info())
-        except UnauthorizedException:
-            response = __manual_login(agent=agent, vault=vault)
+    try:
+        response = LoginResponse(*AuthenticationApi(api_client).get_current_user_with_http_info())
+    except UnauthorizedException:
+        return None
+
+    # NOTE: 有効と確認できたCookieだけを、旧形式から現在の形式に書き換える
+    vault.migrate()
 
     return response
 
 
+def __prepare_client(
+    agent:  str                 = constant.AGENT,
+    client: Optional[ApiClient] = None
+) -> ContextManager[ApiClient]:
+
+    """
+
+    マニュアルログインに必要なvrchatapiのモジュールを読み込み、利用するApiClientを用意する機能を提供する
+    読み込みに時間がかかるので、マニュアルログインでは入力待ちの間にワーカースレッドで実行する
+
+    :param agent: 使い捨てのApiClientに設定するエージェント文字列（clientが渡された場合は利用しない）
+    :type agent: str
+
+    :param client: リクエストに用いるApiClientオブジェクト（Noneで使い捨てのApiClientを構築）
+    :type client: Optional[ApiClient]
+
+    :return: ApiClientを返すコンテキストマネージャー
+    :rtype: ContextManager[ApiClient]
+
+    """
+
+    # Process
+    # NOTE: 読み込みのみが目的なので、importした名前は利用しない
+    # pylint: disable=import-outside-toplevel,unused-import
+    import vrchatapi.api.authentication_api
+    import vrchatapi.exceptions
+    import vrchatapi.models
+
+    return open_client(agent, client)
+
+
 def __two_factor_auth(
     auth:   AuthenticationApi,
-    reason: str
-) -> AuthenticationApi:
+    reason: str,
+    prompt: Callable[[str], str] = input
+) -> Tuple[AuthenticationApi, Optional[Mapping[str, Any]]]:
 
     """
 
@@ -202,20 +385,71 @@ def __two_factor_auth(
     :param reason: マニュアルログインが否認された理由（内容に応じて処理内容が異なる）
     :type reason: str
 
-    :return: 2段階認証コードを設定したAuthenticationApiオブジェクト
-    :type: AuthenticationApi
+    :param prompt: 2段階認証コードの入力を要求する関数
+    :type prompt: Callable[[str], str]
+
+    :return: 2段階認証コードを設定したAuthenticationApiオブジェクトと、2段階認証の応答ヘッダー
+             （2段階認証を行わなかった場合はNone）
+    :rtype: Tuple[AuthenticationApi, Optional[Mapping[str, Any]]]
+
+    """
+
+    # Initialize
+    code:    str
+    match:   Optional[re.Match[str]]
+    headers: Mapping[str, Any]
+
+    # Process
+    match = _TWO_FACTOR_PATTERN.search(reason)
+    if match is None:
+        return auth, None
+
+    # NOTE: 2段階認証は稀なパスなので、モデルのimportは必要になった時点まで遅延させる
+    # pylint: disable=import-outside-toplevel
+    if match.group(1):
+        from vrchatapi.models.two_factor_email_code import TwoFactorEmailCode
+        code = prompt("Email 2FA Code: ")
+        _, _, headers = auth.verify2_fa_email_code_with_http_info(
+            two_factor_email_code=TwoFactorEmailCode(code)
+        )
+    else:
+        from vrchatapi.models.two_factor_auth_code import TwoFactorAuthCode
+        code = prompt("2FA Code: ")
+        _, _, headers = auth.verify2_fa_with_http_info(
+            two_factor_auth_code=TwoFactorAuthCode(code)
+        )
+
+    return auth, headers
+
+
+def __merge_set_cookie(*headers: Optional[Mapping[str, Any]]) -> Dict[str, List[str]]:
+
+    """
+
+    複数のレスポンスヘッダーからSet-Cookieの値を集め、1つのヘッダーとしてまとめる機能を提供する
+    CookieVault.extract()に渡すと、後に渡したヘッダーのCookieが優先される
+
+    :param headers: Set-Cookieを含む可能性のあるレスポンスヘッダー（Noneは無視する）
+    :type headers: Optional[Mapping[str, Any]]
+
+    :return: Set-Cookieの値を順番に並べたヘッダー
+    :rtype: Dict[str, List[str]]
 
     """
 
     # Initialize
-    code: str
+    values:     List[str] = []
+    header:     Optional[Mapping[str, Any]]
+    set_cookie: Any
 
     # Process
-    if "Email 2 Factor Authentication" in reason:
-        code = input("Email 2FA Code: ")
-        auth.verify2_fa_email_code(two_factor_email_code=TwoFactorEmailCode(code))
-    elif "2 Factor Authentication" in reason:
-        code = input("2FA Code: ")
-        auth.verify2_fa(two_factor_auth_code=TwoFactorAuthCode(code))
-
-    return auth
+    for header in headers:
+        if header is None:
+            continue
+        set_cookie = header.get("Set-Cookie") or header.get("set-cookie")
+        if isinstance(set_cookie, list):
+            values.extend(set_cookie)
+        elif set_cookie:
+            values.append(str(set_cookie))
+
+    return {"Set-Cookie": values}
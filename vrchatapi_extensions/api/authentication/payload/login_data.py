@@ -7,12 +7,19 @@
 """
 
 
+from __future__ import annotations
+
 # SECTION: Packages(Built-in)
 import copy
 from dataclasses import dataclass
+from types import MappingProxyType
 # SECTION: Packages(Type Annotation)
-from multiprocessing import pool
-from typing import Any, Dict
+from typing import TYPE_CHECKING, Any, Dict, Mapping
+
+# SECTION: Packages(Third-Party)
+# NOTE: CurrentUserは型注釈でのみ使用するので、実行時にはvrchatapiのモデルを読み込まない
+if TYPE_CHECKING:
+    from vrchatapi.models.current_user import CurrentUser
 
 
 # SECTION: Public Classes
@@ -24,49 +31,79 @@ class LoginResponse:
     ログインリクエストのレスポンスを格納するクラス
 
     :param __user: ログイン先のユーザー情報
-    :type __user: pool.ApplyResult
+    :type __user: CurrentUser
 
     :param status: リクエストのステータスコード
     :type status: int
 
-    :param __headers: レスポンスのヘッダー情報
+    :param __headers: レスポンスのヘッダー情報（構築時に読み取り専用のビューに変換される）
     :type __headers: Dict[str, Any]
 
     """
 
     # Initialize
-    __user:    pool.ApplyResult
+    __user:    CurrentUser
     status:    int
     __headers: Dict[str, Any]
 
+    def __post_init__(self) -> None:
+
+        """
+
+        ヘッダー情報を構築時に1回だけコピーし、読み取り専用のMappingProxyTypeで包む
+        これによりheadersプロパティはアクセスのたびにコピーを作らずに済む
+        copy.copy()はurllib3のHTTPHeaderDictの中身を共有してしまうので、各型のcopy()で複製する
+        （HTTPHeaderDictのままなので、大文字小文字を区別しない参照も維持される）
+
+        """
+
+        # NOTE: frozen=Trueなのでobject.__setattr__で差し替える
+        object.__setattr__(
+            self, "_LoginResponse__headers", MappingProxyType(self.__headers.copy())
+        )
+
     @property
-    def user(self) -> pool.ApplyResult:
+    def user(self) -> CurrentUser:
 
         """
 
-        frozen=Trueでuserへの再代入は禁止できているが
-        pool.ApplyResultへの要素への再代入は禁止されていないのでプロパティを用いてコピーを返すようにし
-        元のデータを保護している
+        サーバーから返ってきたユーザー情報をそのまま返す
+        アクセスのたびにdeepcopyするのは高コストなので、
+        元のデータを保護したい場合はuser_copy()を利用する
 
         :return: サーバーから返ってきたユーザー情報
-        :rtype: pool.ApplyResult
+        :rtype: CurrentUser
 
         """
 
-        return copy.deepcopy(self.__user)
+        return self.__user
 
     @property
-    def headers(self) -> Dict[str, Any]:
+    def headers(self) -> Mapping[str, Any]:
 
         """
 
         frozen=Trueでheadersへの再代入は禁止できているが
-        Dict[str, Any]への要素への再代入は禁止されていないのでプロパティを用いてコピーを返すようにし
+        Dict[str, Any]への要素への再代入は禁止されていないので、構築時に読み取り専用のビューに包み
         元のデータを保護している
 
         :return: サーバーから返ってきたヘッダー情報
-        :rtype: Dict[str, Any]
+        :rtype: Mapping[str, Any]
+
+        """
+
+        return self.__headers
+
+    def user_copy(self) -> CurrentUser:
 
         """
 
-        return copy.deepcopy(self.__headers)
+        ユーザー情報のディープコピーを返す
+        返り値を書き換えても元のデータには影響しない
+
+        :return: サーバーから返ってきたユーザー情報のコピー
+        :rtype: CurrentUser
+
+        """
+
+        return copy.deepcopy(self.__user)
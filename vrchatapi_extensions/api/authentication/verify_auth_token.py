@@ -7,20 +7,27 @@ Cookieが有効化確認する機能を提供する
 """
 
 
+from __future__ import annotations
+
+# SECTION: Packages(Type Annotation)
+from typing import TYPE_CHECKING, Optional
+
 # SECTION: Packages(Third-Party)
-import vrchatapi
-from vrchatapi.api.authentication_api import AuthenticationApi
-from vrchatapi.api_client import ApiClient
+# NOTE: vrchatapiは読み込みが重いので、型注釈以外では関数の中でimportする
+if TYPE_CHECKING:
+    from vrchatapi.api.authentication_api import AuthenticationApi
+    from vrchatapi.api_client import ApiClient
 
 # SECTION: Packages(Local)
 from vrchatapi_extensions.constant import constant
-from vrchatapi_extensions.utils import CookieVault
+from vrchatapi_extensions.utils import CookieVault, open_client
 
 
 # SECTION: Public Functions
 def verify_auth_token(
-    agent: str         = constant.AGENT,
-    vault: CookieVault = CookieVault()
+    agent:  str                   = constant.AGENT,
+    vault:  Optional[CookieVault] = None,
+    client: Optional[ApiClient]   = None
 ) -> bool:
 
     """
@@ -31,8 +38,11 @@ def verify_auth_token(
     :param agent:
     :type agent: str
 
-    :param vault:
-    :type vault: CookieVault
+    :param vault: 端末に保存されたCookieの情報をマネジメントするオブジェクト（Noneで共有のCookieVaultを利用）
+    :type vault: Optional[CookieVault]
+
+    :param client: リクエストに用いるApiClientオブジェクト（Noneで使い捨てのApiClientを構築）
+    :type client: Optional[ApiClient]
 
     :return: Cookieの有効性を真偽値で返す
     :rtype: bool
@@ -40,26 +50,25 @@ def verify_auth_token(
     """
 
     # Initialize
-    config: vrchatapi.Configuration
-    client: ApiClient
-    auth:   AuthenticationApi
+    api_client: ApiClient
+    auth:       AuthenticationApi
 
     # Process
     agent = agent or constant.AGENT
-    config = vrchatapi.Configuration()
+    if vault is None:
+        vault = CookieVault.default()
 
-    if not vault.is_active:
-        # NOTE: 初回のCookie読み込みを行う
-        vault.load()
+    if not vault.ensure_loaded():
+        # NOTE: Cookieの読み込みに失敗している（2回目以降の呼び出しでは読み込みを行わない）
+        return False
 
-        if not vault.is_active:
-            # NOTE: not vault.is_active => Cookieの読み込みに失敗している
-            return False
+    # NOTE: vrchatapiは読み込みが重いので、実際に通信する時点までimportを遅延させる
+    # pylint: disable=import-outside-toplevel
+    from vrchatapi.api.authentication_api import AuthenticationApi
 
-    with ApiClient(config) as client:
-        client.user_agent = agent
-        vault.set_configuration(client)
-        auth = AuthenticationApi(client)
+    with open_client(agent, client) as api_client:
+        vault.set_configuration(api_client)
+        auth = AuthenticationApi(api_client)
 
         # INFO: auth.verify_auth_token()の戻り値は{'ok': bool値, 'token': cookie値}なので、tokenを返さないようにする
         result = auth.verify_auth_token()
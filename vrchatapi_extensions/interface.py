@@ -7,12 +7,22 @@ user-related settings.
 """
 
 
+from __future__ import annotations
+
 # SECTION: Packages(Built-in)
+import getpass
 from dataclasses import dataclass
-from typing import Optional
+from typing import TYPE_CHECKING, Callable, Optional
+
+# SECTION: Packages(Third-Party)
+if TYPE_CHECKING:
+    from vrchatapi.api_client import ApiClient
 
 # SECTION: Packages(Local)
 from vrchatapi_extensions.api import Authentication
+from vrchatapi_extensions.api.authentication.payload import LoginResponse
+from vrchatapi_extensions.constant import constant
+from vrchatapi_extensions.utils import CookieVault, shared_client
 
 
 # SECTION: Public Classes
@@ -28,25 +38,101 @@ class Interface:
     agent configurations.
     """
 
-    __cookie_verify: bool = False
+    __cookie_verify: bool                = False
+    __agent:         str                 = constant.AGENT
+    __client:        Optional[ApiClient] = None
 
     authentication = Authentication
 
-    def __init__(self, auto_cookie_verify: bool = True) -> None:
+    def __init__(
+        self,
+        auto_cookie_verify: bool = True,
+        agent:              str  = constant.AGENT
+    ) -> None:
 
         """
         Initializes the class providing the setup for user authentication and relevant attributes.
 
-        :param agent: Optional; The agent string used in the authentication process.
-        :type agent: Optional[str]
+        :param auto_cookie_verify: Whether to verify the stored cookie on construction.
+        :type auto_cookie_verify: bool
+
+        :param agent: The agent string attached to the requests made through this interface.
+        :type agent: str
 
         :raises RuntimeError: Raised if called without a valid login.
         """
 
+        # Initialize
+        vault: CookieVault
+
         # Process
-        if auto_cookie_verify:
-            self.__cookie_verify = self.authentication.verify_auth_token()
+        self.__cookie_verify = False
+        self.__agent = agent
+        self.__client = None
+
+        if not auto_cookie_verify:
+            return
+
+        # NOTE: Cookieが存在しない場合は、ApiClientを構築せずにローカルの確認だけで終える
+        vault = CookieVault.default()
+        if vault.ensure_loaded():
+            # NOTE: 共有のApiClientを使い、後続のlogin()と接続を使い回せるようにする
+            self.__cookie_verify = self.authentication.verify_auth_token(
+                agent, vault=vault, client=self.client
+            )
 
     @property
     def cookie_verify(self) -> bool:
         return self.__cookie_verify
+
+    @property
+    def client(self) -> ApiClient:
+
+        """
+        Returns the ApiClient shared by this interface for its agent.
+
+        The client is built on first access, kept on the interface, and is the
+        same process-wide instance returned by `shared_client(agent)`, so the
+        cookie verification and `login()` reuse one connection pool. It must
+        not be closed by the caller, nor shared across concurrent logins.
+
+        :return: The shared ApiClient.
+        :rtype: ApiClient
+        """
+
+        # Process
+        if self.__client is None:
+            self.__client = shared_client(self.__agent)
+
+        return self.__client
+
+    def login(
+        self,
+        username:      Optional[str]        = None,
+        password:      Optional[str]        = None,
+        prompt:        Callable[[str], str] = input,
+        secret_prompt: Callable[[str], str] = getpass.getpass
+    ) -> LoginResponse:
+
+        """
+        Logs in through `Authentication.login()` with this interface's agent
+        and shared client, so the connection opened by the cookie
+        verification is reused. The client's `Cookie` header left over from
+        the verification is reset by the login itself.
+
+        :param username: The username or email address used for a manual login.
+        :type username: Optional[str]
+        :param password: The password used for a manual login.
+        :type password: Optional[str]
+        :param prompt: The function asking for the username or 2FA code.
+        :type prompt: Callable[[str], str]
+        :param secret_prompt: The function asking for the password.
+        :type secret_prompt: Callable[[str], str]
+        :return: The response from the VRChat API server.
+        :rtype: LoginResponse
+        """
+
+        # Process
+        return self.authentication.login(
+            username, password, self.__agent, prompt, secret_prompt, client=self.client
+        )
@@ -6,7 +6,12 @@ The module imports `CookieVault` from
 `vrchatapi_extensions.utils.crypto`. The `CookieVault` class is
 intended to manage cookies in a secure and encrypted manner, providing
 useful methods for handling cookie storage and retrieval.
+
+It also provides `shared_client` and `open_client` from
+`vrchatapi_extensions.utils.client`, which manage the `ApiClient`
+instances used for requests so that connections can be reused.
 """
 
 
+from .client import open_client, shared_client
 from .crypto import CookieVault
@@ -0,0 +1,108 @@
+"""
+
+VRChatAPIへのリクエストに用いるApiClientを管理する機能を提供する
+
+- shared_client(): エージェントごとに共有される長寿命のApiClientを返す
+- open_client(): 渡されたApiClient、または使い捨てのApiClientをコンテキストマネージャーとして返す
+
+"""
+
+
+from __future__ import annotations
+
+# SECTION: Packages(Type Annotation)
+from typing import TYPE_CHECKING, ContextManager, Optional
+
+# SECTION: Packages(Built-in)
+from contextlib import nullcontext
+from functools import lru_cache
+
+# SECTION: Packages(Third-Party)
+# NOTE: vrchatapiは読み込みが重いので、型注釈以外ではApiClientを構築する時点でimportする
+if TYPE_CHECKING:
+    from vrchatapi.api_client import ApiClient
+
+# SECTION: Packages(Local)
+from vrchatapi_extensions.constant import constant
+
+
+# SECTION: Public Functions
+@lru_cache(maxsize=8)
+def shared_client(agent: str = constant.AGENT) -> ApiClient:
+
+    """
+
+    エージェントごとに1つだけ構築され、プロセス内で共有されるApiClientを返す
+    urllib3のコネクションプールが共有されるので、verify_auth_token()とlogin()のように
+    連続するリクエストでTCP/TLSの接続を使い回せる
+    共有のため、呼び出し側でcloseやwithによる終了処理を行わないこと
+
+    :param agent: リクエストに添付するエージェント文字列
+    :type agent: str
+
+    :return: user_agentを設定した共有のApiClientオブジェクト
+    :rtype: ApiClient
+
+    """
+
+    # Process
+    return _create_client(agent)
+
+
+def open_client(
+    agent:  str                 = constant.AGENT,
+    client: Optional[ApiClient] = None
+) -> ContextManager[ApiClient]:
+
+    """
+
+    withで利用するApiClientを返す
+    clientが渡された場合はそのまま返し、withを抜けても終了処理を行わない
+    clientがNoneの場合はagentを設定した使い捨てのApiClientを構築する
+
+    :param agent: 使い捨てのApiClientに設定するエージェント文字列（clientが渡された場合は利用しない）
+    :type agent: str
+
+    :param client: 利用するApiClientオブジェクト（Noneで使い捨てのApiClientを構築）
+    :type client: Optional[ApiClient]
+
+    :return: ApiClientを返すコンテキストマネージャー
+    :rtype: ContextManager[ApiClient]
+
+    """
+
+    # Process
+    if client is not None:
+        return nullcontext(client)
+
+    return _create_client(agent)
+
+
+# SECTION: Private Functions
+def _create_client(agent: str) -> ApiClient:
+
+    """
+
+    agentを設定したApiClientを構築する
+
+    :param agent: リクエストに添付するエージェント文字列
+    :type agent: str
+
+    :return: user_agentを設定したApiClientオブジェクト
+    :rtype: ApiClient
+
+    """
+
+    # Initialize
+    client: ApiClient
+
+    # Process
+    # NOTE: vrchatapiは読み込みが重いので、実際に通信する時点までimportを遅延させる
+    # pylint: disable=import-outside-toplevel
+    import vrchatapi
+    from vrchatapi.api_client import ApiClient
+
+    client = ApiClient(vrchatapi.Configuration())
+    client.user_agent = agent
+
+    return client
@@ -5,33 +5,72 @@
 """
 
 
+from __future__ import annotations
+
 # SECTION: Packages(Type Annotation)
 from typing import (
+    TYPE_CHECKING,
     Any,
     Dict,
-    Optional
+    Final,
+    List,
+    Mapping,
+    Optional,
+    Union
 )
 
 # SECTION: Packages(Built-in)
+import base64
 import json
 import os
+import re
+import secrets
+import tempfile
+import threading
 from contextlib import suppress
-from dataclasses import dataclass
-from http.cookies import SimpleCookie
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 
 # SECTION: Packages(Third-Party)
-import keyring
-from cryptography.fernet import Fernet
-from vrchatapi import ApiClient
+# NOTE: ApiClientは型注釈でのみ使用するので、実行時にはvrchatapiを読み込まない
+# NOTE: keyringとcryptographyも読み込みが重いので、Vaultを実際に復号・暗号化する時点でimportする
+if TYPE_CHECKING:
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+    from vrchatapi import ApiClient
+
+# NOTE: orjsonは任意依存。インストールされていない場合は標準のjsonにフォールバックする
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # SECTION: Packages(Local)
 from vrchatapi_extensions.constant import constant
 
 
+# SECTION: Constants
+# NOTE: 保存形式は「バージョン(1byte) + nonce(12byte) + AES-GCMの暗号文」
+# INFO: 旧形式のFernetトークンはbase64文字列("gAAAAA...")なので、先頭の制御文字で区別できる
+_VAULT_VERSION: Final[bytes] = b"\x01"
+_NONCE_SIZE:    Final[int]   = 12
+
+# NOTE: 旧形式のFernetと同じ鍵をAES-GCMに流用しないよう、keyringの鍵からHKDFで専用の鍵を導出する
+_GCM_KEY_INFO: Final[bytes] = b"vrchatapi_extensions cookie vault aes-256-gcm v1"
+
+# NOTE: Set-Cookieから必要な2つのCookieの値だけを取り出す（Path等の属性は「;」の後なのでマッチしない）
+# INFO: 1つのヘッダーに畳み込まれた複数のCookieは「,」、リストで渡された値は改行で区切られる
+_COOKIE_PATTERN: Final[re.Pattern[str]] = re.compile(
+    r'(?:^|[,\n])\s*(auth|twoFactorAuth)="?([^";,\s]*)'
+)
+
+# NOTE: 複数スレッドが同時に鍵を生成して上書きし合わないよう、取得と生成をまとめてロックする
+_KEY_LOCK: Final[threading.Lock] = threading.Lock()
+
+
 # SECTION: Public Classes
-@dataclass(slots=True)
-class CookieVault:
+@dataclass(slots=True, eq=False)
+class CookieVault:  # pylint: disable=too-many-instance-attributes
 
     """
     Manages encrypted storage and retrieval of cookies.
@@ -47,6 +86,12 @@ class CookieVault:
     account_name: str             = "cookie-dek"
     store_path:   Path            = constant.COOKIE
     _ciphertext:  Optional[bytes] = None
+    _header:      Optional[str]   = field(default=None, init=False, repr=False)
+    _loaded:      bool            = field(default=False, init=False, repr=False)
+
+    # NOTE: keyringへの問い合わせと復号はコストが高いので、結果をインスタンスに保持する
+    _cipher_cache: Optional[AESGCM]         = field(default=None, init=False, repr=False)
+    _plain_cache:  Optional[Dict[str, Any]] = field(default=None, init=False, repr=False)
 
     # SECTION: Properties
     @property
@@ -66,6 +111,51 @@ class CookieVault:
         # Process
         return self._ciphertext is not None
 
+    @property
+    def is_legacy(self) -> bool:
+
+        """
+        Checks whether the loaded ciphertext is still in the Fernet format
+        written by older versions. Such a vault stays readable and is
+        rewritten in the current format by `migrate()` or the next `save()`.
+
+        :return: A boolean indicating whether the vault needs migration.
+        :rtype: Bool
+        """
+
+        # Process
+        return self._ciphertext is not None and self._ciphertext[:1] != _VAULT_VERSION
+
+    @property
+    def cookie_header(self) -> str:
+
+        """
+        Returns the value of the `Cookie` request header built from the stored
+        cookies. The header is built once and reused until the vault is loaded
+        or saved again, so repeated login attempts do not rebuild it.
+
+        :return: The `Cookie` header value.
+        :rtype: str
+        """
+
+        # Initialize
+        data:  Dict[str, Any]
+        auth:  Any
+        twofa: Any
+
+        # Process
+        if self._header is None:
+            # NOTE: get()を2回呼ぶと復号結果の参照も2回になるので、1回の復号結果から取り出す
+            data = self._decrypt()
+            auth = data.get("auth")
+            twofa = data.get("twoFactorAuth")
+            self._header = _build_cookie_header(
+                auth if isinstance(auth, str) else None,
+                twofa if isinstance(twofa, str) else None
+            )
+
+        return self._header
+
     # SECTION: Public Functions
     def load(self) -> None:
 
@@ -77,11 +167,33 @@ class CookieVault:
         """
 
         # Process
-        if self.store_path.exists():
+        self._header = None
+        self._plain_cache = None
+        self._loaded = True
+
+        # NOTE: exists()での事前確認はstatが1回増える上にTOCTOUになるので、例外で判定する
+        try:
             self._ciphertext = self.store_path.read_bytes()
-        else:
+        except FileNotFoundError:
             self._ciphertext = None
 
+    def ensure_loaded(self) -> bool:
+
+        """
+        Loads the ciphertext on the first call only and reports whether the
+        vault is active. Later calls skip the file access entirely and only
+        return the current state, so callers can probe the vault cheaply.
+
+        :return: A boolean indicating whether the vault is active.
+        :rtype: Bool
+        """
+
+        # Process
+        if not self._loaded:
+            self.load()
+
+        return self.is_active
+
     def save(
         self,
         cookies: Dict[str, str]
@@ -89,9 +201,16 @@ class CookieVault:
 
         """
         Saves the given cookies securely by encrypting and storing them in a specified path.
-        The method ensures that the storage directory exists before writing the encrypted
-        data to a file. Additionally, it attempts to set restrictive file permissions
-        to enhance security post-saving.
+        The storage directory is created only when the file cannot be created because
+        it is missing. The data is written to a uniquely named temporary file first and
+        then moved into place, so an interrupted save never leaves a truncated cookie
+        file behind and concurrent saves never write to the same temporary file. The
+        temporary file is created with owner-only permissions, so the ciphertext is
+        never readable by other users, even briefly, and it is removed again if the
+        save does not complete. If the vault already holds the same cookies (as last
+        decrypted) and the file still contains exactly the ciphertext this vault last
+        loaded or wrote, nothing is written; a file rewritten by another vault or
+        process in the meantime is always overwritten.
 
         :param cookies: A dictionary containing the cookies to be saved as key-value pairs.
         :type cookies: Dict[str, str]
@@ -101,18 +220,68 @@ class CookieVault:
         # Initialize
         plain: bytes
         token: bytes
+        fd:    int
+        tmp:   str
 
         # Process
-        plain = json.dumps(cookies, ensure_ascii=False).encode("utf-8")
-        token = self._fernet().encrypt(plain)
-
-        self.store_path.parent.mkdir(parents=True, exist_ok=True)
-        self.store_path.write_bytes(token)
+        # NOTE: 同じCookieで再ログインした場合は、暗号化とファイルの書き換えを省略する
+        # INFO: 比較は復号済みのキャッシュとのみ行う（旧形式のファイルは移行のために書き換える）
+        # INFO: 他のVaultやプロセスが書き換えていないか、ファイルの中身が自身の暗号文のままかも確認する
+        #       （1回の読み込みは暗号化とファイルの置き換えより十分に安い）
+        if (
+            self._plain_cache == cookies
+            and not self.is_legacy
+            and self._store_unchanged()
+        ):
+            return
+
+        plain = _dumps(cookies)
+        token = self._encrypt(plain)
+
+        # NOTE: mkstempは一意な名前のファイルを0o600で作成するので、同時に保存しても一時ファイルが衝突しない
+        # NOTE: ディレクトリは通常既に存在するので、毎回mkdirせずに作成できなかった場合のみ作成する
+        try:
+            fd, tmp = tempfile.mkstemp(dir=self.store_path.parent, prefix=self.store_path.name)
+        except FileNotFoundError:
+            self.store_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.store_path.parent, prefix=self.store_path.name)
+
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(token)
+
+            # NOTE: os.replaceはPOSIX/Windowsの両方でアトミックに置き換えられる
+            os.replace(tmp, self.store_path)
+        except BaseException:
+            # NOTE: 置き換えに至らなかった一時ファイル（暗号文を含む）を残さない
+            with suppress(OSError):
+                os.unlink(tmp)
+            raise
         self._ciphertext = token
+        self._header = None
+        # NOTE: 保存したばかりの内容を次のget()で復号し直さないよう、平文をそのままキャッシュする
+        self._plain_cache = dict(cookies)
+
+    def migrate(self) -> bool:
+
+        """
+        Rewrites a vault still in the old Fernet format in the current
+        AES-GCM format. Reading a legacy vault never writes to disk, so
+        callers decide when the migration happens (e.g. after the stored
+        cookie has been confirmed to be valid).
+
+        :return: True if the vault was rewritten, False if it was already
+            current or empty.
+        :rtype: Bool
+        """
+
+        # Process
+        if not self.ensure_loaded() or not self.is_legacy:
+            return False
 
-        # NOTE: Windowsではchmodがサポートされていないが、実行する必要がないのでエラーを握りつぶす
-        with suppress(Exception):
-            os.chmod(self.store_path, 0o600)
+        self.save(self._decrypt())
+
+        return True
 
     def get(
         self,
@@ -156,27 +325,65 @@ class CookieVault:
         :return: None
         """
 
-        # Initialize
-        auth:  Optional[str]
-        twofa: Optional[str]
+        # Process
+        client.default_headers["Cookie"] = self.cookie_header
 
-        header: str = ""
+    @classmethod
+    @lru_cache(maxsize=1)
+    def default(cls) -> "CookieVault":
+
+        """
+        Returns the process-wide vault for the default storage path. The
+        instance is created on first use and shared afterwards, so callers
+        that do not pass their own vault reuse the same loaded ciphertext
+        instead of constructing and loading a new vault every time.
+
+        The file is read only once, on the first `ensure_loaded()`. If another
+        process may rewrite it (e.g. after an external re-login), refresh the
+        shared vault with `CookieVault.default().load()`, or drop it with
+        `CookieVault.default.cache_clear()` so the next call creates a new one.
+        The cookie login does the former by itself once before falling back to
+        a manual login.
+
+        :return: The shared vault for the default storage path.
+        :rtype: CookieVault
+        """
 
         # Process
-        auth = self.get("auth")
-        if auth is not None:
-            header = f"auth={auth}"
+        return cls()
 
-        twofa = self.get("twoFactorAuth")
-        if twofa is not None:
-            header += f"; twoFactorAuth={twofa}"
+    @classmethod
+    def load_many(
+        cls,
+        paths: List[Path]
+    ) -> List["CookieVault"]:
 
-        client.default_headers["Cookie"] = header
+        """
+        Creates and loads one vault per given storage path, for setups that
+        keep several accounts' cookies side by side. This is a convenience
+        loop over `load()`, so each file is read once per call. The vaults
+        can be passed to `login()` individually, one per account.
+
+        :param paths: The storage paths of the encrypted cookie files.
+        :type paths: List[Path]
+        :return: The loaded vaults, in the same order as the given paths.
+        :rtype: List[CookieVault]
+        """
+
+        # Initialize
+        vaults: List[CookieVault]
+
+        # Process
+        vaults = [cls(store_path=path) for path in paths]
+        for vault in vaults:
+            vault.load()
+
+        return vaults
 
     @classmethod
     def extract(
         cls,
-        header: Optional[dict]
+        header: Optional[Mapping[str, Any]]
     ) -> Optional[Dict[str, str]]:
 
         """
@@ -188,15 +395,16 @@ class CookieVault:
 
         :param header: The dictionary containing HTTP headers, potentially including
             cookies under the "Set-Cookie" or "set-cookie" key.
-        :type header: Optional[dict]
+        :type header: Optional[Mapping[str, Any]]
         :return: A `Cookie` object containing the "auth" cookie value if it exists, or
             None if the "auth" cookie is not found or the provided header is invalid.
         :rtype: Optional[Cookie]
         """
 
         # Initialize
-        set_cookie: Optional[str]
-        jar:        SimpleCookie
+        set_cookie: Optional[Union[str, List[str]]]
+        raw:        str
+        jar:        Dict[str, str]
 
         # Process
         if header is None:
@@ -207,16 +415,17 @@ class CookieVault:
         if not set_cookie:
             return None
 
-        jar = SimpleCookie(set_cookie)
+        raw = "\n".join(set_cookie) if isinstance(set_cookie, list) else str(set_cookie)
 
-        if isinstance(set_cookie, list):
-            for sc in set_cookie:
-                jar.load(sc)
-        else:
-            jar.load(str(set_cookie))
+        # NOTE: authを含まないヘッダーはパースせずに早期リターンする
+        if "auth=" not in raw:
+            return None
+
+        # INFO: 同じ名前のCookieが複数ある場合は後の値が優先される
+        jar = dict(_COOKIE_PATTERN.findall(raw))
 
-        auth = jar["auth"].value if "auth" in jar else None
-        twofa = jar["twoFactorAuth"].value if "twoFactorAuth" in jar else None
+        auth = jar.get("auth")
+        twofa = jar.get("twoFactorAuth")
         if not auth:
             return None
 
@@ -230,40 +439,108 @@ class CookieVault:
 
         """
         Generates or retrieves a cryptographic key associated with the service and
-        account name from a secure keyring. If no key exists, a new cryptographic
-        key is generated, stored securely, and returned.
+        account name from a secure keyring. If no key exists, 32 random bytes are
+        generated, stored securely, and returned. The key is kept in the keyring as
+        urlsafe base64, the same encoding older Fernet-based versions used.
 
-        :return: A cryptographic key in byte format.
+        The key is cached in process memory per service/account pair, so the
+        keyring backend is queried at most once per process. The trade-off is
+        that the key stays in memory for the lifetime of the process.
+
+        :return: The raw 32-byte key.
         :rtype: Bytes
         """
 
-        # Initialize
-        key_b64: Optional[str]
-        key:     bytes
+        # Process
+        return _fetch_key(self.service_name, self.account_name)
+
+    def _store_unchanged(self) -> bool:
+
+        """
+        Checks whether the storage file still contains exactly the ciphertext
+        this vault last loaded or wrote, i.e. nobody else has rewritten it.
+
+        :return: True if the file content equals the held ciphertext, False if
+            it differs or the file does not exist.
+        :rtype: Bool
+        """
 
         # Process
-        key_b64 = keyring.get_password(self.service_name, self.account_name)
-        if key_b64 is None:
-            key = Fernet.generate_key()
-            keyring.set_password(self.service_name, self.account_name, key.decode("ascii"))
-            return key
-        return key_b64.encode("ascii")
+        try:
+            return self.store_path.read_bytes() == self._ciphertext
+        except FileNotFoundError:
+            return False
 
-    def _fernet(self) -> Fernet:
+    def _cipher(self) -> AESGCM:
 
         """
-        Generates a Fernet instance.
+        Generates an AES-GCM instance.
 
-        This method returns an instance of the Fernet class, which is a symmetric key
-        cryptography implementation. The returned instance is initialized using the
-        symmetric encryption key.
+        The AES-256-GCM key is derived from the keyring-stored key with
+        HKDF-SHA256, so the bytes that older versions used as the Fernet key
+        are never used directly by another algorithm. The instance is built
+        once and cached, so the keyring is queried only on the first call.
 
-        :return: Fernet instance
-        :rtype: Fernet
+        :return: AESGCM instance
+        :rtype: AESGCM
         """
 
         # Process
-        return Fernet(self._get_key())
+        if self._cipher_cache is None:
+            # pylint: disable=import-outside-toplevel
+            from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+            from cryptography.hazmat.primitives.hashes import SHA256
+            from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+
+            self._cipher_cache = AESGCM(
+                HKDF(algorithm=SHA256(), length=32, salt=None, info=_GCM_KEY_INFO)
+                .derive(self._get_key())
+            )
+
+        return self._cipher_cache
+
+    def _encrypt(
+        self,
+        plain: bytes
+    ) -> bytes:
+
+        """
+        Encrypts the given bytes with AES-GCM under a fresh random nonce.
+        The version byte is prepended and also bound as associated data.
+
+        :param plain: The bytes to encrypt.
+        :type plain: bytes
+        :return: The version byte, the nonce and the ciphertext.
+        :rtype: bytes
+        """
+
+        # Initialize
+        nonce: bytes
+
+        # Process
+        nonce = os.urandom(_NONCE_SIZE)
+
+        return _VAULT_VERSION + nonce + self._cipher().encrypt(nonce, plain, _VAULT_VERSION)
+
+    def _decrypt_legacy(
+        self,
+        token: bytes
+    ) -> bytes:
+
+        """
+        Decrypts a vault written by older versions, which stored a Fernet token.
+
+        :param token: The Fernet token.
+        :type token: bytes
+        :return: The decrypted bytes.
+        :rtype: bytes
+        """
+
+        # Process
+        # pylint: disable=import-outside-toplevel
+        from cryptography.fernet import Fernet
+
+        return Fernet(base64.urlsafe_b64encode(self._get_key())).decrypt(token)
 
     def _decrypt(self) -> Dict[str, Any]:
 
@@ -271,10 +548,13 @@ class CookieVault:
         Decrypts the encrypted data stored in the object and returns it as a
         dictionary.
 
-        This method uses Fernet symmetric encryption to decrypt the
-        stored ciphertext. It assumes the object has valid ciphertext
-        to decrypt. If the ciphertext is missing or invalid, an error
-        will be raised.
+        This method uses AES-GCM to decrypt the stored ciphertext. It
+        assumes the object has valid ciphertext to decrypt. If the
+        ciphertext is missing or invalid, an error will be raised. The
+        decrypted dictionary is cached until the ciphertext is loaded
+        again; save() replaces it with the cookies it just wrote. A vault
+        still in the old Fernet format is decrypted without being rewritten;
+        see `migrate()`.
 
         :raises RuntimeError: If the ciphertext is empty indicating the object
             has not been properly initialized with encrypted data.
@@ -283,11 +563,131 @@ class CookieVault:
         """
 
         # Initialize
-        plain: bytes
+        token: bytes
+        nonce: bytes
+        data:  Dict[str, Any]
 
         # Process
         if not self._ciphertext:
             raise RuntimeError("cookie vault is empty. call load() or save() first.")
-        plain = self._fernet().decrypt(self._ciphertext)
 
-        return json.loads(plain.decode("utf-8"))
+        if self._plain_cache is not None:
+            return self._plain_cache
+
+        token = self._ciphertext
+        if token[:1] == _VAULT_VERSION:
+            nonce = token[1:1 + _NONCE_SIZE]
+            data = _loads(self._cipher().decrypt(nonce, token[1 + _NONCE_SIZE:], _VAULT_VERSION))
+        else:
+            data = _loads(self._decrypt_legacy(token))
+
+        self._plain_cache = data
+
+        return data
+
+
+# SECTION: Private Functions
+# NOTE: keyringへの問い合わせ（LinuxではDBus経由）は遅いので、鍵はプロセス内で使い回す
+@lru_cache(maxsize=8)
+def _fetch_key(
+    service: str,
+    account: str
+) -> bytes:
+
+    """
+    Retrieves the raw vault key for a service/account pair from the keyring,
+    generating and storing a new one on first use. The result is memoized per
+    pair, so the keyring backend is queried at most once per process.
+
+    :param service: The keyring service name.
+    :type service: str
+    :param account: The keyring account name.
+    :type account: str
+    :return: The raw 32-byte key.
+    :rtype: bytes
+    """
+
+    # Initialize
+    key_b64: Optional[str]
+    key:     bytes
+
+    # Process
+    # pylint: disable=import-outside-toplevel
+    import keyring
+
+    # INFO: lru_cacheは同時呼び出し時に本体を重複実行し得るが、直列化されるので後の呼び出しは先に保存された鍵を読み出す
+    with _KEY_LOCK:
+        key_b64 = keyring.get_password(service, account)
+        if key_b64 is None:
+            key = secrets.token_bytes(32)
+            keyring.set_password(service, account, base64.urlsafe_b64encode(key).decode("ascii"))
+            return key
+
+    return base64.urlsafe_b64decode(key_b64)
+
+
+def _build_cookie_header(
+    auth:  Optional[str],
+    twofa: Optional[str]
+) -> str:
+
+    """
+    Builds the value of the `Cookie` request header from the auth and
+    twoFactorAuth cookie values. The result is cached per vault by
+    `CookieVault.cookie_header`, not here, so no session tokens are kept
+    in module state.
+
+    :param auth: The auth cookie value.
+    :type auth: Optional[str]
+    :param twofa: The twoFactorAuth cookie value.
+    :type twofa: Optional[str]
+    :return: The `Cookie` header value.
+    :rtype: str
+    """
+
+    # Process
+    if auth is None:
+        return "" if twofa is None else f"twoFactorAuth={twofa}"
+
+    if twofa is None:
+        return f"auth={auth}"
+
+    return f"auth={auth}; twoFactorAuth={twofa}"
+
+
+def _dumps(data: Dict[str, Any]) -> bytes:
+
+    """
+    Serializes the given dictionary into UTF-8 encoded JSON bytes.
+    Uses orjson when it is available, otherwise falls back to the
+    standard json module.
+
+    :param data: The dictionary to serialize.
+    :type data: Dict[str, Any]
+    :return: UTF-8 encoded JSON bytes.
+    :rtype: Bytes
+    """
+
+    # Process
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+
+def _loads(data: bytes) -> Dict[str, Any]:
+
+    """
+    Deserializes UTF-8 encoded JSON bytes into a dictionary.
+    Uses orjson when it is available, otherwise falls back to the
+    standard json module.
+
+    :param data: UTF-8 encoded JSON bytes.
+    :type data: Bytes
+    :return: The deserialized dictionary.
+    :rtype: Dict[str, Any]
+    """
+
+    # Process
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode("utf-8"))